@@ -1,11 +1,31 @@
 import django_filters
 from accounts.models import CustomUser
+from core.search import similarity_search
 
 class CustomUserFilter(django_filters.FilterSet):
+    similar = django_filters.CharFilter(method="filter_similar")
+    similarity = django_filters.NumberFilter(
+        method="filter_threshold", min_value=0, max_value=1
+    )
+
     class Meta:
         model = CustomUser
         fields = {
             "first_name": ["iexact", "icontains"],
             "last_name": ["iexact", "icontains"],
             "email": ["iexact", "icontains"],
-        }
\ No newline at end of file
+        }
+
+    def filter_similar(self, queryset, name, value):
+        """Fuzzy match on email and names ordered by trigram similarity."""
+        threshold = self.form.cleaned_data.get("similarity")
+        return similarity_search(
+            queryset,
+            ["email", "first_name", "last_name"],
+            value,
+            float(threshold) if threshold is not None else None,
+        )
+
+    def filter_threshold(self, queryset, name, value):
+        """`similarity` only tunes `similar`; it does not filter on its own."""
+        return queryset
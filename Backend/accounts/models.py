@@ -60,6 +60,11 @@ class CustomUser(AbstractUser):
 
     objects = CustomUserManager()
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            models.Index(fields=["-created_at", "-id"], name="customuser_created_idx")
+        ]
+
     def assign_user_group(user): 
         """Assign user to a group based on user_type"""
         if user.user_type == "student":
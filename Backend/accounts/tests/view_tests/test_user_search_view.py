@@ -49,7 +49,7 @@ def test_user_search_view_positive(first_name):
         f"Expected 200, got {response.status_code}, Response: {response.content}"
     )
     # Check search results
-    results = response.json()
+    results = response.json()["results"]
     # Expect the newly created user with that first_name to be in the results
     returned_first_names = [item["first_name"] for item in results]
     assert first_name in returned_first_names, (
@@ -97,5 +97,77 @@ def test_user_search_view_edge_case_no_results():
     assert response.status_code == 200, (
         f"Expected 200, got {response.status_code}, Response: {response.content}"
     )
-    results = response.json()
+    results = response.json()["results"]
     assert len(results) == 0, "Expected zero results for a non-matching filter."
+
+
+@pytest.mark.django_db
+def test_user_search_view_similar_partial_email():
+    """
+    Positive test: `similar=` finds users by a partial email, best match first.
+    """
+    client = APIClient()
+    auth_user = CustomUser.objects.create_user(
+        email=f"{uuid.uuid4()}@example.com", password="testPassword123", user_type="teacher"
+    )
+    CustomUser.objects.create_user(
+        email="jane.doe@university.edu", password="testPassword456", user_type="student"
+    )
+    CustomUser.objects.create_user(
+        email="someone.else@college.org", password="testPassword789", user_type="student"
+    )
+    client.force_authenticate(user=auth_user)
+
+    response = client.get(reverse("user_search") + "?similar=jane.doe@univ")
+
+    assert response.status_code == 200, (
+        f"Expected 200, got {response.status_code}, Response: {response.content}"
+    )
+    emails = [user["email"] for user in response.json()["results"]]
+    assert emails[0] == "jane.doe@university.edu"
+    assert "someone.else@college.org" not in emails
+
+
+@pytest.mark.django_db
+def test_user_search_view_similar_tolerates_typos():
+    """
+    Edge case: with pg_trgm available, a misspelt name still matches.
+    """
+    from core.search import trigram_search_available
+
+    if not trigram_search_available():
+        pytest.skip("pg_trgm is not installed in this database.")
+
+    client = APIClient()
+    auth_user = CustomUser.objects.create_user(
+        email=f"{uuid.uuid4()}@example.com", password="testPassword123", user_type="teacher"
+    )
+    CustomUser.objects.create_user(
+        email=f"{uuid.uuid4()}@example.com",
+        password="testPassword456",
+        first_name="Jonathan",
+        last_name="Smith",
+        user_type="student",
+    )
+    client.force_authenticate(user=auth_user)
+
+    response = client.get(reverse("user_search") + "?similar=Jonathon&similarity=0.3")
+
+    assert response.status_code == 200
+    assert [user["first_name"] for user in response.json()["results"]] == ["Jonathan"]
+
+
+@pytest.mark.django_db
+def test_user_search_view_similarity_threshold_out_of_range():
+    """
+    Negative test: a similarity threshold outside [0, 1] is rejected.
+    """
+    client = APIClient()
+    auth_user = CustomUser.objects.create_user(
+        email=f"{uuid.uuid4()}@example.com", password="testPassword123", user_type="teacher"
+    )
+    client.force_authenticate(user=auth_user)
+
+    response = client.get(reverse("user_search") + "?similar=jane&similarity=1.5")
+
+    assert response.status_code == 400, f"Expected 400, got {response.status_code}"
@@ -0,0 +1,30 @@
+from rest_framework import pagination
+
+
+class CursorPagination(pagination.CursorPagination):
+    """
+    Project-wide keyset pagination, newest first.
+
+    Pages are positioned on `created_at` with `id` as the tie-breaker, so a
+    deep page costs the same as the first one. When a search filter has
+    annotated a relevance score (`rank` or `similarity`), pages follow that
+    ordering instead.
+    """
+
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
+    ordering = ("-created_at", "-id")
+    relevance_annotations = ("rank", "similarity")
+
+    def get_ordering(self, request, queryset, view):
+        for annotation in self.relevance_annotations:
+            if annotation in queryset.query.annotations:
+                return (f"-{annotation}", "-id")
+        return super().get_ordering(request, queryset, view)
+
+
+class EnrolledAtCursorPagination(CursorPagination):
+    """Keyset pagination for enrollments, which have no `created_at`."""
+
+    ordering = ("-enrolled_at", "-id")
@@ -0,0 +1,55 @@
+from functools import lru_cache
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db import connection
+from django.db.models import FloatField, Q
+from django.db.models.functions import Cast, Greatest
+
+# pg_trgm's default `pg_trgm.similarity_threshold`, used by the indexed `%` operator.
+DEFAULT_SIMILARITY_THRESHOLD = 0.3
+
+
+@lru_cache(maxsize=None)
+def _pg_trgm_installed(database_name):
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+        return cursor.fetchone() is not None
+
+
+def trigram_search_available():
+    """Return True when the database can serve pg_trgm similarity queries."""
+    if connection.vendor != "postgresql":
+        return False
+    return _pg_trgm_installed(connection.settings_dict["NAME"])
+
+
+def similarity_search(queryset, fields, value, threshold=None):
+    """
+    Filter `queryset` to rows where any of `fields` resembles `value`, best match first.
+
+    Falls back to a case-insensitive substring match (e.g. on SQLite) when
+    pg_trgm is not available.
+    """
+    if threshold is None:
+        threshold = DEFAULT_SIMILARITY_THRESHOLD
+
+    if not trigram_search_available():
+        match = Q()
+        for field in fields:
+            match |= Q(**{f"{field}__icontains": value})
+        return queryset.filter(match)
+
+    # Cast to double precision so the score round-trips exactly through a
+    # pagination cursor.
+    similarities = [
+        Cast(TrigramSimilarity(field, value), FloatField()) for field in fields
+    ]
+    queryset = queryset.annotate(
+        similarity=Greatest(*similarities) if len(similarities) > 1 else similarities[0]
+    )
+    if threshold >= DEFAULT_SIMILARITY_THRESHOLD:
+        # The `%` operator can use the GIN trigram indexes to narrow candidates.
+        candidates = Q()
+        for field in fields:
+            candidates |= Q(**{f"{field}__trigram_similar": value})
+        queryset = queryset.filter(candidates)
+    return queryset.filter(similarity__gte=threshold).order_by("-similarity", "pk")
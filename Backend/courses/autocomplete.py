@@ -0,0 +1,77 @@
+import threading
+from itertools import islice
+from sortedcontainers import SortedList
+
+
+class CourseTitleIndex:
+    """
+    In-process prefix index over course titles.
+
+    Entries are kept in a sorted list of `(casefolded title, course id)` so a
+    prefix lookup is a bisect followed by a short scan. The index is built
+    from the database on first use and then maintained incrementally by the
+    `Course` signal handlers in `courses.signals`.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = SortedList()
+        self._titles = {}
+        self._loaded = False
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        from courses.models import Course
+
+        with self._lock:
+            if self._loaded:
+                return
+            rows = Course.objects.values_list("id", "title").iterator(chunk_size=2000)
+            self._titles = dict(rows)
+            self._entries = SortedList(
+                (title.casefold(), course_id) for course_id, title in self._titles.items()
+            )
+            self._loaded = True
+
+    def search(self, prefix, limit=10):
+        """Return up to `limit` `{"id", "title"}` dicts whose title starts with `prefix`."""
+        self._ensure_loaded()
+        key = prefix.casefold()
+        results = []
+        with self._lock:
+            for title_key, course_id in islice(self._entries.irange(minimum=(key,)), limit):
+                if not title_key.startswith(key):
+                    break
+                results.append({"id": course_id, "title": self._titles[course_id]})
+        return results
+
+    def upsert(self, course_id, title):
+        """Add a course to the index, or move it if its title changed."""
+        if not self._loaded:
+            return
+        with self._lock:
+            self._discard(course_id)
+            self._titles[course_id] = title
+            self._entries.add((title.casefold(), course_id))
+
+    def remove(self, course_id):
+        if not self._loaded:
+            return
+        with self._lock:
+            self._discard(course_id)
+
+    def reset(self):
+        """Drop the index so it is rebuilt from the database on next use."""
+        with self._lock:
+            self._entries = SortedList()
+            self._titles = {}
+            self._loaded = False
+
+    def _discard(self, course_id):
+        title = self._titles.pop(course_id, None)
+        if title is not None:
+            self._entries.discard((title.casefold(), course_id))
+
+
+course_title_index = CourseTitleIndex()
@@ -1,11 +1,41 @@
 import django_filters
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import F, FloatField
+from django.db.models.functions import Cast
+from core.search import similarity_search
 from courses.models import Course
 
 class CourseFilter(django_filters.FilterSet):
+    q = django_filters.CharFilter(method="filter_full_text")
+    similar = django_filters.CharFilter(method="filter_similar")
+    similarity = django_filters.NumberFilter(
+        method="filter_threshold", min_value=0, max_value=1
+    )
+
     class Meta:
         model = Course
         fields = {
             "title": ["iexact", "icontains"],
             "description": ["iexact", "icontains"],
         }
-        exclude = ["created_at", "updated_at"]
\ No newline at end of file
+        exclude = ["created_at", "updated_at"]
+
+    def filter_full_text(self, queryset, name, value):
+        """Match against the indexed search vector, most relevant first."""
+        query = SearchQuery(value, config="english", search_type="websearch")
+        return (
+            queryset.filter(search_vector=query)
+            .annotate(rank=Cast(SearchRank(F("search_vector"), query), FloatField()))
+            .order_by("-rank", "-created_at")
+        )
+
+    def filter_similar(self, queryset, name, value):
+        """Typo-tolerant title search ordered by trigram similarity."""
+        threshold = self.form.cleaned_data.get("similarity")
+        return similarity_search(
+            queryset, ["title"], value, float(threshold) if threshold is not None else None
+        )
+
+    def filter_threshold(self, queryset, name, value):
+        """`similarity` only tunes `similar`; it does not filter on its own."""
+        return queryset
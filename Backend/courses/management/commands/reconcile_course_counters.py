@@ -0,0 +1,36 @@
+from itertools import islice
+from django.core.management.base import BaseCommand
+from courses.models import Course
+
+
+class Command(BaseCommand):
+    help = "Recompute Course.active_enrollment_count and material_count where they have drifted."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of courses to fix per UPDATE statement.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report how many courses have drifted.",
+        )
+
+    def handle(self, *args, **options):
+        drifted = (
+            Course.objects.with_counter_drift()
+            .values_list("pk", flat=True)
+            .iterator(chunk_size=options["batch_size"])
+        )
+
+        fixed = 0
+        while batch := list(islice(drifted, options["batch_size"])):
+            if not options["dry_run"]:
+                Course.objects.filter(pk__in=batch).reconcile_counters()
+            fixed += len(batch)
+
+        verb = "have drifted" if options["dry_run"] else "reconciled"
+        self.stdout.write(self.style.SUCCESS(f"{fixed} course(s) {verb}."))
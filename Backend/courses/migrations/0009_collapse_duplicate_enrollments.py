@@ -0,0 +1,40 @@
+from django.db import migrations
+from django.db.models import Count
+
+
+def collapse_duplicate_enrollments(apps, schema_editor):
+    """
+    Keep one enrollment per (student, course) before the unique constraint is added.
+
+    Re-enrolling after removal used to insert a new row, so duplicates are
+    collapsed into the oldest row (preserving `enrolled_at`), which takes the
+    `is_active` state of the most recent row.
+    """
+    Enrollment = apps.get_model("courses", "Enrollment")
+    duplicates = (
+        Enrollment.objects.values("student_id", "course_id")
+        .annotate(rows=Count("id"))
+        .filter(rows__gt=1)
+    )
+    for pair in duplicates.iterator():
+        enrollments = list(
+            Enrollment.objects.filter(
+                student_id=pair["student_id"], course_id=pair["course_id"]
+            ).order_by("enrolled_at", "id")
+        )
+        keep, latest = enrollments[0], enrollments[-1]
+        if keep.is_active != latest.is_active:
+            keep.is_active = latest.is_active
+            keep.save(update_fields=["is_active"])
+        Enrollment.objects.filter(pk__in=[e.pk for e in enrollments[1:]]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0008_course_title_trgm'),
+    ]
+
+    operations = [
+        migrations.RunPython(collapse_duplicate_enrollments, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.1.6 on 2026-10-18 20:18
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0011_course_counters'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(fields=['-created_at', '-id'], name='course_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(fields=['teacher', '-created_at', '-id'], name='course_teacher_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='coursematerial',
+            index=models.Index(fields=['course', '-created_at', '-id'], name='material_course_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='enrollment',
+            index=models.Index(fields=['course', '-enrolled_at', '-id'], name='enrollment_course_enrolled_idx'),
+        ),
+    ]
@@ -1,8 +1,56 @@
-from django.db import models
+from django.db import connection, models
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from accounts.models import CustomUser
 from django.core.validators import MinLengthValidator
 
 
+class CourseQuerySet(models.QuerySet):
+    def with_is_enrolled(self, user):
+        """Annotate each course with whether `user` is actively enrolled in it."""
+        return self.annotate(
+            user_is_enrolled=models.Exists(
+                Enrollment.objects.filter(
+                    student_id=user.pk, course=models.OuterRef("pk"), is_active=True
+                )
+            )
+        )
+
+    def _actual_counts(self):
+        """Counter values recomputed from the enrollment and material tables."""
+        def count_of(queryset):
+            counted = (
+                queryset.filter(course=models.OuterRef("pk"))
+                .order_by()
+                .values("course")
+                .annotate(total=models.Count("pk"))
+                .values("total")
+            )
+            return Coalesce(models.Subquery(counted), 0)
+
+        return {
+            "active_enrollment_count": count_of(Enrollment.objects.filter(is_active=True)),
+            "material_count": count_of(CourseMaterial.objects.all()),
+        }
+
+    def with_counter_drift(self):
+        """Return the courses whose stored counters disagree with the source rows."""
+        actual = self._actual_counts()
+        return self.annotate(
+            actual_enrollment_count=actual["active_enrollment_count"],
+            actual_material_count=actual["material_count"],
+        ).exclude(
+            active_enrollment_count=models.F("actual_enrollment_count"),
+            material_count=models.F("actual_material_count"),
+        )
+
+    def reconcile_counters(self):
+        """Recompute the stored counters of every course in the queryset."""
+        return self.update(**self._actual_counts())
+
+
 class Course(models.Model):
     title = models.CharField(max_length=100)
     description = models.TextField()
@@ -11,6 +59,30 @@ class Course(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # Denormalized counters, maintained with F() updates by the enrollment and
+    # material views. `manage.py reconcile_course_counters` repairs drift.
+    active_enrollment_count = models.PositiveIntegerField(default=0)
+    material_count = models.PositiveIntegerField(default=0)
+    # Weighted full-text document (title over description), maintained by
+    # the database so it is always current after a save.
+    search_vector = models.GeneratedField(
+        expression=SearchVector("title", weight="A", config="english")
+        + SearchVector("description", weight="B", config="english"),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    objects = CourseQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=["search_vector"], name="course_search_vector_gin"),
+            # Keyset pagination (see core.pagination.CursorPagination).
+            models.Index(fields=["-created_at", "-id"], name="course_created_idx"),
+            models.Index(
+                fields=["teacher", "-created_at", "-id"], name="course_teacher_created_idx"
+            ),
+        ]
 
     def __str__(self):
         return self.title
@@ -34,10 +106,71 @@ class CourseMaterial(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["course", "-created_at", "-id"], name="material_course_created_idx"
+            )
+        ]
+
     def __str__(self):
         return self.file_name
 
 
+class EnrollmentQuerySet(models.QuerySet):
+    def enroll(self, student, course_id):
+        """
+        Enroll `student` in a course with a single upsert statement.
+
+        A previous inactive enrollment is reactivated rather than duplicated,
+        and the course's `active_enrollment_count` is bumped in the same
+        statement.
+        Returns `(enrollment, course)`: `course` is None when the course does
+        not exist, and `enrollment` is None when the student is already
+        actively enrolled. The returned course only has `id`, `title` and
+        `teacher_id` loaded.
+        """
+        enrollment_table = self.model._meta.db_table
+        course_table = Course._meta.db_table
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                WITH target AS (
+                    SELECT id, title, teacher_id FROM {course_table} WHERE id = %s
+                ), upserted AS (
+                    INSERT INTO {enrollment_table} (student_id, course_id, enrolled_at, is_active)
+                    SELECT %s, target.id, %s, true FROM target
+                    ON CONFLICT (student_id, course_id) DO UPDATE SET is_active = true
+                    WHERE {enrollment_table}.is_active = false
+                    RETURNING id, course_id, enrolled_at
+                ), counted AS (
+                    UPDATE {course_table}
+                    SET active_enrollment_count = active_enrollment_count + 1
+                    WHERE id IN (SELECT course_id FROM upserted)
+                )
+                SELECT target.title, target.teacher_id, upserted.id, upserted.enrolled_at
+                FROM target LEFT JOIN upserted ON true
+                """,
+                [course_id, student.pk, timezone.now()],
+            )
+            row = cursor.fetchone()
+
+        if row is None:
+            return None, None
+        title, teacher_id, enrollment_id, enrolled_at = row
+        course = Course(id=course_id, title=title, teacher_id=teacher_id)
+        if enrollment_id is None:
+            return None, course
+        enrollment = self.model(
+            id=enrollment_id,
+            student=student,
+            course=course,
+            enrolled_at=enrolled_at,
+            is_active=True,
+        )
+        return enrollment, course
+
+
 class Enrollment(models.Model):
     student = models.ForeignKey(
         CustomUser, on_delete=models.CASCADE, related_name="enrollments"
@@ -47,3 +180,29 @@ class Enrollment(models.Model):
     )
     enrolled_at = models.DateTimeField(auto_now_add=True)
     is_active = models.BooleanField(default=True)
+
+    objects = EnrollmentQuerySet.as_manager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["student", "course"], name="unique_enrollment_student_course"
+            )
+        ]
+        indexes = [
+            # Rosters and material notifications filter a course's (active) students.
+            models.Index(
+                fields=["course", "is_active"], name="enrollment_course_active_idx"
+            ),
+            # "Is this student actively enrolled in this course?" checks.
+            models.Index(
+                fields=["student", "course"],
+                condition=models.Q(is_active=True),
+                name="enrollment_active_idx",
+            ),
+            # Keyset pagination of course rosters.
+            models.Index(
+                fields=["course", "-enrolled_at", "-id"],
+                name="enrollment_course_enrolled_idx",
+            ),
+        ]
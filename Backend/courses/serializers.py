@@ -9,10 +9,14 @@ class CourseSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Course
-        fields = "__all__"
+        exclude = ["search_vector"]
+        read_only_fields = ["active_enrollment_count", "material_count"]
 
     def get_is_enrolled(self, obj):
         """Check if the authenticated user is enrolled in this course."""
+        # List views annotate the queryset, so no per-row query is needed.
+        if hasattr(obj, "user_is_enrolled"):
+            return obj.user_is_enrolled
         request = self.context.get("request")
         if request and hasattr(request, "user"):
             return Enrollment.objects.filter(
@@ -28,6 +32,11 @@ class CourseSerializer(serializers.ModelSerializer):
         return value
 
 
+class CourseAutocompleteSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    title = serializers.CharField()
+
+
 class EnrollmentSerializer(serializers.ModelSerializer):
     is_enrolled = serializers.SerializerMethodField()
     student_details = serializers.SerializerMethodField()
@@ -36,8 +45,13 @@ class EnrollmentSerializer(serializers.ModelSerializer):
     class Meta:
         model = Enrollment
         fields = "__all__"
+        # (student, course) uniqueness is enforced by the database upsert in
+        # CourseEnrollView, which reactivates existing rows instead.
+        validators = []
 
     def get_is_enrolled(self, obj):
+        if hasattr(obj, "user_is_enrolled"):
+            return obj.user_is_enrolled
         request = self.context.get("request")
         if request and hasattr(request, "user"):
             return Enrollment.objects.filter(
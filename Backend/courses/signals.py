@@ -0,0 +1,18 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from courses.autocomplete import course_title_index
+from courses.models import Course
+
+
+@receiver(post_save, sender=Course)
+def index_course_title(sender, instance, **kwargs):
+    """Keep the autocomplete index in step with committed course titles."""
+    course_id, title = instance.pk, instance.title
+    transaction.on_commit(lambda: course_title_index.upsert(course_id, title))
+
+
+@receiver(post_delete, sender=Course)
+def unindex_course_title(sender, instance, **kwargs):
+    course_id = instance.pk
+    transaction.on_commit(lambda: course_title_index.remove(course_id))
@@ -0,0 +1,101 @@
+import uuid
+import pytest
+from io import StringIO
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework.test import APIClient
+from accounts.models import CustomUser
+from courses.models import Course, CourseMaterial, Enrollment
+
+
+def make_user(user_type):
+    return CustomUser.objects.create_user(
+        email=f"{uuid.uuid4()}@example.com", password="password123", user_type=user_type
+    )
+
+
+@pytest.mark.django_db
+def test_enrollment_counter_follows_enroll_remove_and_unblock():
+    """
+    Enrolling, removing and unblocking a student keep active_enrollment_count in step.
+    """
+    teacher, student = make_user("teacher"), make_user("student")
+    course = Course.objects.create(title="Counted", description="Desc", teacher=teacher)
+    student_client, teacher_client = APIClient(), APIClient()
+    student_client.force_authenticate(user=student)
+    teacher_client.force_authenticate(user=teacher)
+
+    student_client.post(reverse("course-enroll", kwargs={"pk": course.id}), {}, format="json")
+    course.refresh_from_db()
+    assert course.active_enrollment_count == 1
+
+    enrollment = Enrollment.objects.get(student=student, course=course)
+    kwargs = {"course_id": course.id, "pk": enrollment.id}
+    teacher_client.put(reverse("remove-student", kwargs=kwargs))
+    # Removing twice must not decrement twice.
+    teacher_client.put(reverse("remove-student", kwargs=kwargs))
+    course.refresh_from_db()
+    assert course.active_enrollment_count == 0
+
+    teacher_client.put(reverse("unblock-student", kwargs=kwargs))
+    course.refresh_from_db()
+    assert course.active_enrollment_count == 1
+
+    teacher_client.put(reverse("remove-student", kwargs=kwargs))
+    student_client.post(reverse("course-enroll", kwargs={"pk": course.id}), {}, format="json")
+    course.refresh_from_db()
+    assert course.active_enrollment_count == 1
+
+
+@pytest.mark.django_db
+def test_material_counter_follows_uploads():
+    """
+    Uploading material increments material_count.
+    """
+    teacher = make_user("teacher")
+    course = Course.objects.create(title="Counted", description="Desc", teacher=teacher)
+    client = APIClient()
+    client.force_authenticate(user=teacher)
+
+    response = client.post(
+        reverse("course-material-upload", kwargs={"pk": course.id}),
+        {
+            "course": course.id,
+            "file_name": "Lecture 1",
+            "description": "Slides for week one",
+            "file": SimpleUploadedFile("slides.pdf", b"dummy data"),
+        },
+        format="multipart",
+    )
+
+    assert response.status_code == 201, response.content
+    course.refresh_from_db()
+    assert course.material_count == 1
+
+
+@pytest.mark.django_db
+def test_reconcile_course_counters_command_fixes_drift():
+    """
+    The management command recomputes counters that were bypassed by direct writes.
+    """
+    teacher, student = make_user("teacher"), make_user("student")
+    drifted = Course.objects.create(title="Drifted", description="Desc", teacher=teacher)
+    accurate = Course.objects.create(title="Accurate", description="Desc", teacher=teacher)
+    Enrollment.objects.create(student=student, course=drifted)
+    Enrollment.objects.create(student=make_user("student"), course=drifted, is_active=False)
+    CourseMaterial.objects.create(course=drifted, file_name="Notes", description="Notes")
+
+    out = StringIO()
+    call_command("reconcile_course_counters", "--dry-run", stdout=out)
+    assert "1 course(s) have drifted" in out.getvalue()
+    drifted.refresh_from_db()
+    assert drifted.active_enrollment_count == 0
+
+    out = StringIO()
+    call_command("reconcile_course_counters", "--batch-size", "1", stdout=out)
+    assert "1 course(s) reconciled" in out.getvalue()
+    drifted.refresh_from_db()
+    accurate.refresh_from_db()
+    assert (drifted.active_enrollment_count, drifted.material_count) == (1, 1)
+    assert (accurate.active_enrollment_count, accurate.material_count) == (0, 0)
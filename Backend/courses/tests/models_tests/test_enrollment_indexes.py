@@ -0,0 +1,59 @@
+import uuid
+import pytest
+from django.db import IntegrityError, connection, transaction
+from accounts.models import CustomUser
+from courses.models import Course, Enrollment
+
+
+@pytest.fixture
+def enrollment():
+    teacher = CustomUser.objects.create_user(
+        email=f"{uuid.uuid4()}@example.com", password="teacherpass", user_type="teacher"
+    )
+    student = CustomUser.objects.create_user(
+        email=f"{uuid.uuid4()}@example.com", password="studentpass", user_type="student"
+    )
+    course = Course.objects.create(title="Indexed", description="Desc", teacher=teacher)
+    return Enrollment.objects.create(student=student, course=course)
+
+
+def explain_without_seqscan(queryset):
+    """EXPLAIN the queryset as the planner would on a table too large to scan."""
+    with connection.cursor() as cursor:
+        cursor.execute("SET LOCAL enable_seqscan = off")
+    return queryset.explain()
+
+
+@pytest.mark.django_db
+def test_active_enrollment_lookup_uses_partial_index(enrollment):
+    """
+    The (student, course, is_active=True) hot-path lookup is served by the partial index.
+    """
+    plan = explain_without_seqscan(
+        Enrollment.objects.filter(
+            student=enrollment.student, course=enrollment.course, is_active=True
+        )
+    )
+    assert "enrollment_active_idx" in plan, plan
+
+
+@pytest.mark.django_db
+def test_course_roster_lookup_uses_composite_index(enrollment):
+    """
+    Filtering a course's active students is served by the (course, is_active) index.
+    """
+    plan = explain_without_seqscan(
+        Enrollment.objects.filter(course=enrollment.course, is_active=True)
+    )
+    assert "enrollment_course_active_idx" in plan, plan
+
+
+@pytest.mark.django_db
+def test_duplicate_enrollment_is_rejected(enrollment):
+    """
+    A student can hold at most one enrollment row per course.
+    """
+    with pytest.raises(IntegrityError), transaction.atomic():
+        Enrollment.objects.create(
+            student=enrollment.student, course=enrollment.course, is_active=False
+        )
@@ -0,0 +1,99 @@
+import uuid
+import pytest
+from rest_framework.test import APIClient
+from django.urls import reverse
+from accounts.models import CustomUser
+from courses.autocomplete import course_title_index
+from courses.models import Course
+
+
+@pytest.fixture(autouse=True)
+def fresh_index():
+    """Rebuild the process-wide index from each test's database state."""
+    course_title_index.reset()
+    yield
+    course_title_index.reset()
+
+
+def make_teacher():
+    return CustomUser.objects.create_user(
+        email=f"{uuid.uuid4()}@example.com", password="teacherpass", user_type="teacher"
+    )
+
+
+@pytest.mark.django_db
+def test_course_autocomplete_view_positive():
+    """
+    Positive test: titles starting with the prefix are returned case-insensitively, in order.
+    """
+    client = APIClient()
+    teacher = make_teacher()
+    client.force_authenticate(user=teacher)
+    for title in ["Python Basics", "python advanced", "Pottery", "Java Basics"]:
+        Course.objects.create(title=title, description="Desc", teacher=teacher)
+
+    response = client.get(reverse("course-autocomplete") + "?prefix=PYTH")
+
+    assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+    assert [course["title"] for course in response.data] == [
+        "python advanced",
+        "Python Basics",
+    ]
+
+
+@pytest.mark.django_db
+def test_course_autocomplete_view_negative_unauthenticated():
+    """
+    Negative test: anonymous users cannot query the index.
+    """
+    response = APIClient().get(reverse("course-autocomplete") + "?prefix=py")
+    assert response.status_code in [401, 403]
+
+
+@pytest.mark.django_db
+def test_course_autocomplete_view_tracks_saves_and_deletes(
+    django_capture_on_commit_callbacks,
+):
+    """
+    Edge case: the index follows creates, renames and deletes without a rebuild.
+    """
+    client = APIClient()
+    teacher = make_teacher()
+    client.force_authenticate(user=teacher)
+    url = reverse("course-autocomplete")
+
+    # Load the index before the courses exist.
+    assert client.get(url + "?prefix=Data").data == []
+
+    with django_capture_on_commit_callbacks(execute=True):
+        course = Course.objects.create(
+            title="Data Science", description="Desc", teacher=teacher
+        )
+    assert [c["title"] for c in client.get(url + "?prefix=data").data] == ["Data Science"]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        course.title = "Statistics"
+        course.save()
+    assert client.get(url + "?prefix=data").data == []
+    assert [c["id"] for c in client.get(url + "?prefix=stat").data] == [course.id]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        course.delete()
+    assert client.get(url + "?prefix=stat").data == []
+
+
+@pytest.mark.django_db
+def test_course_autocomplete_view_edge_case_limit():
+    """
+    Edge case: `limit` caps the number of suggestions and an empty prefix returns nothing.
+    """
+    client = APIClient()
+    teacher = make_teacher()
+    client.force_authenticate(user=teacher)
+    for i in range(5):
+        Course.objects.create(title=f"Course {i}", description="Desc", teacher=teacher)
+    url = reverse("course-autocomplete")
+
+    assert len(client.get(url + "?prefix=course&limit=3").data) == 3
+    assert client.get(url + "?prefix=").data == []
+    assert client.get(url + "?prefix=course&limit=abc").status_code == 400
@@ -90,3 +90,61 @@ def test_course_enroll_view_edge_case_non_existent_course():
 
     # Using .get() on a nonexistent course triggers a 404
     assert response.status_code == 404, f"Expected 404, got {response.status_code}, Response: {response.json()}"
+
+
+@pytest.mark.django_db
+def test_course_enroll_view_reactivates_removed_student():
+    """
+    Edge case: A removed student who enrolls again reuses their previous enrollment row.
+    """
+    client = APIClient()
+    teacher = CustomUser.objects.create_user(
+        email=f"{uuid.uuid4()}@example.com", password="teacherpass", user_type="teacher"
+    )
+    course = Course.objects.create(title="Sample Course", description="Desc", teacher=teacher)
+    student = CustomUser.objects.create_user(
+        email=f"{uuid.uuid4()}@example.com", password="studentpass", user_type="student"
+    )
+    enrollment = Enrollment.objects.create(student=student, course=course, is_active=False)
+    client.force_authenticate(user=student)
+
+    url = reverse("course-enroll", kwargs={"pk": course.id})
+    response = client.post(url, {"student": student.id, "course": course.id}, format="json")
+
+    assert response.status_code == 201, f"Expected 201, got {response.status_code}, Response: {response.json()}"
+    assert Enrollment.objects.filter(student=student, course=course).count() == 1
+    enrollment.refresh_from_db()
+    assert enrollment.is_active
+
+    response = client.post(url, {"student": student.id, "course": course.id}, format="json")
+    assert response.status_code == 400, f"Expected 400, got {response.status_code}"
+
+
+@pytest.mark.django_db
+def test_course_enroll_view_single_query():
+    """
+    Performance test: Enrolling runs one database statement, including the teacher lookup.
+    """
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    client = APIClient()
+    teacher = CustomUser.objects.create_user(
+        email=f"{uuid.uuid4()}@example.com", password="teacherpass", user_type="teacher"
+    )
+    course = Course.objects.create(title="Sample Course", description="Desc", teacher=teacher)
+    student = CustomUser.objects.create_user(
+        email=f"{uuid.uuid4()}@example.com", password="studentpass", user_type="student"
+    )
+    client.force_authenticate(user=student)
+
+    url = reverse("course-enroll", kwargs={"pk": course.id})
+    with CaptureQueriesContext(connection) as queries:
+        response = client.post(url, {}, format="json")
+
+    assert response.status_code == 201, f"Expected 201, got {response.status_code}, Response: {response.json()}"
+    assert len(queries.captured_queries) == 1, queries.captured_queries
+    data = response.json()
+    assert data["course_title"] == "Sample Course"
+    assert data["is_enrolled"] is True
+    assert data["student_details"]["email"] == student.email
@@ -46,8 +46,8 @@ def test_course_list_view_positive(course_title):
         get_response.status_code == 200
     ), f"Expected 200, got {get_response.status_code}"
     # Ensure the created course is returned
-    assert len(get_response.data) == 1
-    assert get_response.data[0]["title"] == course_title
+    assert len(get_response.data["results"]) == 1
+    assert get_response.data["results"][0]["title"] == course_title
 
 
 @pytest.mark.django_db
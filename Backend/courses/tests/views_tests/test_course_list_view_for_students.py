@@ -36,8 +36,8 @@ def test_course_list_view_for_students_positive(course_title):
     response = client.get(url)
 
     assert response.status_code == 200, f"Expected 200, got {response.status_code}"
-    assert len(response.data) == 1, "Expected one course in the response"
-    assert response.data[0]["title"] == course_title
+    assert len(response.data["results"]) == 1, "Expected one course in the response"
+    assert response.data["results"][0]["title"] == course_title
 
 
 @pytest.mark.django_db
@@ -60,7 +60,7 @@ def test_course_list_view_for_students_negative_non_student():
 @pytest.mark.django_db
 def test_course_list_view_for_students_edge_case_no_enrollments():
     """
-    Edge case: a student with no enrollments should see a custom message.
+    Edge case: a student with no enrollments should get an empty page.
     """
     client = APIClient()
     student = CustomUser.objects.create_user(
@@ -74,5 +74,5 @@ def test_course_list_view_for_students_edge_case_no_enrollments():
     response = client.get(url)
 
     assert response.status_code == 200, f"Expected 200, got {response.status_code}"
-    assert "message" in response.data, "Expected a custom message in the response"
-    assert response.data["message"] == "You are not enrolled in any courses."
+    assert response.data["results"] == [], "Expected an empty page of courses"
+    assert response.data["next"] is None
@@ -41,7 +41,7 @@ def test_course_material_list_view_positive(file_name, description):
         f"Expected 200, got {response.status_code}, Response: {response.json()}"
     )
     # Check that the material appears in the response
-    materials = response.json()
+    materials = response.json()["results"]
     assert len(materials) == 1, "Expected 1 course material in the list"
     assert materials[0]["file_name"] == file_name
 
@@ -87,5 +87,5 @@ def test_course_material_list_view_edge_case_no_materials():
     assert response.status_code == 200, (
         f"Expected 200, got {response.status_code}, Response: {response.json()}"
     )
-    materials = response.json()
+    materials = response.json()["results"]
     assert len(materials) == 0, "Expected 0 course materials in the list"
\ No newline at end of file
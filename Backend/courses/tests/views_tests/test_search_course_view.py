@@ -4,7 +4,7 @@ from django.urls import reverse
 from rest_framework.test import APIClient
 from hypothesis import given, strategies as st, settings
 from accounts.models import CustomUser
-from courses.models import Course
+from courses.models import Course, Enrollment
 
 @pytest.mark.django_db
 @settings(deadline=None)
@@ -36,7 +36,7 @@ def test_search_course_view_positive(course_title):
     assert response.status_code == 200, (
         f"Expected 200, got {response.status_code}, Response: {response.json()}"
     )
-    results = response.json()
+    results = response.json()["results"]
     assert len(results) == 1, "Expected exactly one course in the search results."
     assert results[0]["title"] == course_title, "Returned course title does not match."
 
@@ -79,5 +79,119 @@ def test_search_course_view_edge_case_no_results():
     assert response.status_code == 200, (
         f"Expected 200, got {response.status_code}, Response: {response.content}"
     )
-    results = response.json()
+    results = response.json()["results"]
     assert len(results) == 0, "Expected zero courses in the search results."
+
+
+@pytest.mark.django_db
+def test_search_course_view_query_count_is_flat():
+    """
+    Performance test: resolving `is_enrolled` must not issue one query per course.
+    """
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    client = APIClient()
+    student = CustomUser.objects.create_user(
+        email=f"{uuid.uuid4()}@example.com", password="pass1234", user_type="student"
+    )
+    teacher = CustomUser.objects.create_user(
+        email=f"{uuid.uuid4()}@example.com", password="pass1234", user_type="teacher"
+    )
+    client.force_authenticate(user=student)
+    url = reverse("course-search")
+
+    def create_courses(count):
+        for i in range(count):
+            course = Course.objects.create(
+                title=f"Course {uuid.uuid4()}", description="Test", teacher=teacher
+            )
+            if i % 2 == 0:
+                Enrollment.objects.create(student=student, course=course)
+
+    create_courses(2)
+    with CaptureQueriesContext(connection) as small_page:
+        response = client.get(url)
+    assert len(response.json()["results"]) == 2
+
+    create_courses(20)
+    with CaptureQueriesContext(connection) as large_page:
+        response = client.get(url)
+    results = response.json()["results"]
+    assert len(results) == 22
+    assert sum(course["is_enrolled"] for course in results) == 11
+
+    assert len(large_page.captured_queries) == len(small_page.captured_queries)
+
+
+@pytest.mark.django_db
+def test_search_course_view_full_text_ranks_title_matches_first():
+    """
+    Positive test: `q=` runs a full-text search and ranks title matches above description matches.
+    """
+    client = APIClient()
+    user = CustomUser.objects.create_user(
+        email=f"{uuid.uuid4()}@example.com", password="pass1234", user_type="teacher"
+    )
+    client.force_authenticate(user=user)
+
+    Course.objects.create(
+        title="Cooking basics", description="Recipes for programming students", teacher=user
+    )
+    Course.objects.create(
+        title="Programming in Python", description="An introduction", teacher=user
+    )
+    Course.objects.create(title="Art history", description="Paintings", teacher=user)
+
+    response = client.get(reverse("course-search") + "?q=programs")
+    assert response.status_code == 200, (
+        f"Expected 200, got {response.status_code}, Response: {response.content}"
+    )
+    titles = [course["title"] for course in response.json()["results"]]
+    assert titles == ["Programming in Python", "Cooking basics"]
+    assert "search_vector" not in response.json()["results"][0]
+
+
+@pytest.mark.django_db
+def test_search_course_view_similar_matches_partial_title():
+    """
+    Positive test: `similar=` finds courses from a fragment of their title.
+    """
+    client = APIClient()
+    user = CustomUser.objects.create_user(
+        email=f"{uuid.uuid4()}@example.com", password="pass1234", user_type="teacher"
+    )
+    client.force_authenticate(user=user)
+    Course.objects.create(title="Machine Learning", description="Test", teacher=user)
+    Course.objects.create(title="Medieval Poetry", description="Test", teacher=user)
+
+    response = client.get(reverse("course-search") + "?similar=Machine Learn")
+
+    assert response.status_code == 200, (
+        f"Expected 200, got {response.status_code}, Response: {response.content}"
+    )
+    assert [course["title"] for course in response.json()["results"]] == ["Machine Learning"]
+
+
+@pytest.mark.django_db
+def test_search_course_view_full_text_pages_follow_rank():
+    """
+    Edge case: Cursor pages of a `q=` search keep relevance order across pages.
+    """
+    client = APIClient()
+    user = CustomUser.objects.create_user(
+        email=f"{uuid.uuid4()}@example.com", password="pass1234", user_type="teacher"
+    )
+    client.force_authenticate(user=user)
+    Course.objects.create(title="Other", description="databases", teacher=user)
+    Course.objects.create(title="Databases", description="databases", teacher=user)
+    Course.objects.create(title="Databases", description="Intro", teacher=user)
+
+    titles = []
+    url = reverse("course-search") + "?q=databases&page_size=1"
+    while url:
+        page = client.get(url).json()
+        titles.extend(course["title"] for course in page["results"])
+        url = page["next"]
+
+    assert titles == ["Databases", "Databases", "Other"]
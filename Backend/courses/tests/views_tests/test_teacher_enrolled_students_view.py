@@ -42,7 +42,7 @@ def test_teacher_enrolled_students_view_positive(course_title):
     assert (
         response.status_code == 200
     ), f"Expected 200, got {response.status_code}, Response: {response.content}"
-    enrolled_list = response.json()
+    enrolled_list = response.json()["results"]
     assert len(enrolled_list) == 1, "There should be exactly one enrolled student"
     assert enrolled_list[0]["student_details"]["email"] == student.email
 
@@ -88,5 +88,5 @@ def test_teacher_enrolled_students_view_edge_case_no_enrollments():
     assert (
         response.status_code == 200
     ), f"Expected 200, got {response.status_code}, Response: {response.content}"
-    enrolled_list = response.json()
+    enrolled_list = response.json()["results"]
     assert len(enrolled_list) == 0, "Expected no enrollments in the response"
\ No newline at end of file
@@ -8,6 +8,11 @@ urlpatterns = [
         "<int:pk>/", views.CourseDetailViewForStudents.as_view(), name="course-detail"
     ),
     path("course/search/", views.SearchCourseView.as_view(), name="course-search"),
+    path(
+        "course/autocomplete/",
+        views.CourseAutocompleteView.as_view(),
+        name="course-autocomplete",
+    ),
     path(
         "list/students/",
         views.CourseListViewForStudents.as_view(),
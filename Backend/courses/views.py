@@ -1,20 +1,25 @@
 from .models import Course, Enrollment, CourseMaterial
 from .serializers import (
+    CourseAutocompleteSerializer,
     CourseSerializer,
     EnrollmentSerializer,
     CourseMaterialSerializer,
 )
 from rest_framework import generics, permissions, status, serializers
-from drf_spectacular.utils import extend_schema
+from drf_spectacular.utils import extend_schema, OpenApiParameter
 from rest_framework.response import Response
 from notifications.tasks import (
     notify_teacher_on_enrollment,
     notify_students_on_material_upload,
 )
 from user_permissions.user_permissions import IsTeacher, IsStudent
+from courses.autocomplete import course_title_index
 from courses.filters import CourseFilter
+from core.pagination import EnrolledAtCursorPagination
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework.generics import get_object_or_404
+from rest_framework.exceptions import NotFound
+from django.db import transaction
+from django.db.models import F
 
 
 class CourseListView(generics.ListCreateAPIView):
@@ -26,19 +31,9 @@ class CourseListView(generics.ListCreateAPIView):
         """Return courses owned by the authenticated teacher."""
         user = self.request.user
         if user.user_type == "teacher":
-            return Course.objects.filter(teacher=user)
+            return Course.objects.filter(teacher=user).with_is_enrolled(user)
         return Course.objects.none()
 
-    def list(self, request, *args, **kwargs):
-        """Return a custom response when no courses are found."""
-        queryset = self.get_queryset()
-        if not queryset.exists():
-            return Response(
-                {"message": "You have not created any courses."},
-                status=status.HTTP_200_OK,
-            )
-        return super().list(request, *args, **kwargs)
-
     def get_permissions(self):
         if self.request.method == "POST":
             return [IsTeacher()]
@@ -59,17 +54,7 @@ class CourseListViewForStudents(generics.ListAPIView):
         user = self.request.user
         return Course.objects.filter(
             enrolled_students__student=user, enrolled_students__is_active=True
-        )
-
-    def list(self, request, *args, **kwargs):
-        """Return a custom response when no enrollments are found."""
-        queryset = self.get_queryset()
-        if not queryset.exists():
-            return Response(
-                {"message": "You are not enrolled in any courses."},
-                status=status.HTTP_200_OK,
-            )
-        return super().list(request, *args, **kwargs)
+        ).with_is_enrolled(user)
 
 
 class CourseDetailViewForStudents(generics.RetrieveAPIView):
@@ -103,33 +88,31 @@ class CourseEnrollView(generics.CreateAPIView):
     serializer_class = EnrollmentSerializer
     permission_classes = [IsStudent]
 
-    def perform_create(self, serializer):
-        student = self.request.user
+    def create(self, request, *args, **kwargs):
+        """Enroll, or re-enroll, the student in one round-trip."""
+        student = request.user
         course_id = self.kwargs.get("pk")
         if not course_id:
             raise serializers.ValidationError("Course ID is required.")
-        course = get_object_or_404(Course, pk=course_id)
 
-        # Check if already enrolled
-        if Enrollment.objects.filter(
-            student=student, course=course, is_active=True
-        ).exists():
+        enrollment, course = Enrollment.objects.enroll(student, course_id)
+        if course is None:
+            raise NotFound("Course not found")
+        if enrollment is None:
             raise serializers.ValidationError(
                 "You are already enrolled in this course."
             )
 
-        enrollment = serializer.save(student=student, course=course)
-
         notify_teacher_on_enrollment.delay(
-            course_id=enrollment.course.id,
+            course_id=course.id,
             student_name=student.email,
-            teacher_id=enrollment.course.teacher.id,
+            teacher_id=course.teacher_id,
         )
 
-        return Response(
-            {"message": "Enrolled successfully!", "course_id": course.id},
-            status=status.HTTP_201_CREATED,
-        )
+        # The student is enrolled by construction; skip the per-row lookup.
+        enrollment.user_is_enrolled = True
+        serializer = self.get_serializer(enrollment)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
 
     def get_serializer_context(self):
         """Pass request context to serializer so is_enrolled can be computed."""
@@ -147,7 +130,11 @@ class CourseMaterialUploadView(generics.CreateAPIView):
 
     def perform_create(self, serializer):
         """Ensure course exists and notify students."""
-        material = serializer.save()
+        with transaction.atomic():
+            material = serializer.save()
+            Course.objects.filter(pk=material.course_id).update(
+                material_count=F("material_count") + 1
+            )
 
         enrolled_students = Enrollment.objects.filter(
             course=material.course
@@ -191,6 +178,7 @@ class TeacherEnrolledStudentsView(generics.ListAPIView):
 
     serializer_class = EnrollmentSerializer
     permission_classes = [IsTeacher]
+    pagination_class = EnrolledAtCursorPagination
 
     def get_queryset(self):
         """Ensure only authenticated teachers can fetch enrolled students."""
@@ -233,8 +221,14 @@ class RemoveStudentView(generics.UpdateAPIView):
                 status=403,
             )
 
-        enrollment.is_active = False
-        enrollment.save()
+        with transaction.atomic():
+            changed = Enrollment.objects.filter(
+                pk=enrollment.pk, is_active=True
+            ).update(is_active=False)
+            if changed:
+                Course.objects.filter(
+                    pk=enrollment.course_id, active_enrollment_count__gt=0
+                ).update(active_enrollment_count=F("active_enrollment_count") - 1)
         return Response(
             {"message": "Student removed from course."}, status=status.HTTP_200_OK
         )
@@ -261,8 +255,14 @@ class UnblockStudentView(generics.UpdateAPIView):
                 status=403,
             )
 
-        enrollment.is_active = True
-        enrollment.save()
+        with transaction.atomic():
+            changed = Enrollment.objects.filter(
+                pk=enrollment.pk, is_active=False
+            ).update(is_active=True)
+            if changed:
+                Course.objects.filter(pk=enrollment.course_id).update(
+                    active_enrollment_count=F("active_enrollment_count") + 1
+                )
         return Response(
             {"message": "Student unblocked from course."}, status=status.HTTP_200_OK
         )
@@ -271,8 +271,40 @@ class UnblockStudentView(generics.UpdateAPIView):
 class SearchCourseView(generics.ListAPIView):
     """Users can search for courses."""
 
-    queryset = Course.objects.all()
     serializer_class = CourseSerializer
     permission_classes = [permissions.IsAuthenticated]
     filter_backends = [DjangoFilterBackend]
     filterset_class = CourseFilter
+
+    def get_queryset(self):
+        """Return all courses annotated with the user's enrollment state."""
+        return Course.objects.with_is_enrolled(self.request.user)
+
+
+class CourseAutocompleteView(generics.GenericAPIView):
+    """Suggest course titles for a prefix from the in-memory title index."""
+
+    serializer_class = CourseAutocompleteSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    max_limit = 50
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter("prefix", str, required=True),
+            OpenApiParameter("limit", int, description="Defaults to 10, at most 50."),
+        ],
+        responses={200: CourseAutocompleteSerializer(many=True)},
+    )
+    def get(self, request, *args, **kwargs):
+        prefix = request.query_params.get("prefix", "").strip()
+        if not prefix:
+            return Response([], status=status.HTTP_200_OK)
+
+        try:
+            limit = int(request.query_params.get("limit", 10))
+        except ValueError:
+            raise serializers.ValidationError({"limit": "Must be an integer."})
+        limit = max(1, min(limit, self.max_limit))
+
+        matches = course_title_index.search(prefix, limit)
+        return Response(self.get_serializer(matches, many=True).data)
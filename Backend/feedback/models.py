@@ -12,5 +12,13 @@ class Feedback(models.Model):
     comment = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["-created_at", "-id"], name="feedback_created_idx"),
+            models.Index(
+                fields=["course", "-created_at", "-id"], name="feedback_course_created_idx"
+            ),
+        ]
+
     def __str__(self):
         return self.student.email
@@ -9,6 +9,7 @@ class FeedbackView(generics.ListCreateAPIView):
 
     queryset = Feedback.objects.all()
     serializer_class = FeedbackSerializer
+    filterset_fields = ["course"]
 
     def get_permissions(self):
         if self.request.method == "POST":
@@ -9,5 +9,12 @@ class Notification(models.Model):
     content = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["user", "-created_at", "-id"], name="notification_user_created_idx"
+            )
+        ]
+
     def __str__(self):
         return f"Notification for {self.user.username}: {self.content}"
\ No newline at end of file
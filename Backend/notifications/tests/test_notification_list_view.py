@@ -31,7 +31,7 @@ def test_notification_list_view_positive():
     assert response.status_code == 200, (
         f"Expected 200, got {response.status_code}, Response: {response.content}"
     )
-    response_data = response.json()
+    response_data = response.json()["results"]
     assert len(response_data) == 2, "Expected two notifications in the response."
     
 
@@ -81,5 +81,34 @@ def test_notification_list_view_edge_case_no_notifications():
     assert response.status_code == 200, (
         f"Expected 200, got {response.status_code}, Response: {response.content}"
     )
-    response_data = response.json()
+    response_data = response.json()["results"]
     assert len(response_data) == 0, "Expected zero notifications in the response."
+
+
+@pytest.mark.django_db
+def test_notification_list_view_cursor_pagination():
+    """
+    Edge case: Following `next` cursors walks every notification once, newest first.
+    """
+    client = APIClient()
+    user = CustomUser.objects.create_user(
+        email=f"{uuid.uuid4()}@example.com",
+        password="testPassword123",
+        user_type="student",
+    )
+    client.force_authenticate(user=user)
+    created = [
+        Notification.objects.create(user=user, content=f"Notification {i}") for i in range(5)
+    ]
+
+    seen = []
+    url = reverse("notification-list") + "?page_size=2"
+    while url:
+        response = client.get(url)
+        assert response.status_code == 200
+        page = response.json()
+        assert len(page["results"]) <= 2
+        seen.extend(item["id"] for item in page["results"])
+        url = page["next"]
+
+    assert seen == [n.id for n in reversed(created)]
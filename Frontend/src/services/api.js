@@ -19,4 +19,16 @@ api.interceptors.request.use(
   }
 );
 
+// List endpoints are cursor-paginated; follow `next` until every page is loaded.
+export const fetchAllPages = async (url) => {
+  const results = [];
+  let next = url;
+  while (next) {
+    const response = await api.get(next);
+    results.push(...response.data.results);
+    next = response.data.next;
+  }
+  return results;
+};
+
 export default api;
@@ -1,6 +1,6 @@
 import { useEffect, useState } from 'react'
 import { CAlert, CContainer } from '@coreui/react'
-import api from '../../../services/api'
+import api, { fetchAllPages } from '../../../services/api'
 
 const Notifications = () => {
   const [notifications, setNotifications] = useState([])
@@ -9,8 +9,7 @@ const Notifications = () => {
     // Fetch stored notifications from the API
     const fetchNotifications = async () => {
       try {
-        const response = await api.get('/api/notifications/notifications/')
-        setNotifications(response.data)
+        setNotifications(await fetchAllPages('/api/notifications/notifications/'))
       } catch (error) {
         console.error('Error fetching notifications:', error)
       }
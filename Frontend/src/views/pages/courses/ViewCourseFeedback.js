@@ -1,7 +1,7 @@
 import React, { useEffect, useState } from 'react'
 import { useParams } from 'react-router-dom'
 import { CCard, CCardBody, CCardHeader, CListGroup, CListGroupItem, CSpinner } from '@coreui/react'
-import api from '../../../services/api'
+import api, { fetchAllPages } from '../../../services/api'
 
 const ViewCourseFeedback = () => {
   const { id } = useParams()
@@ -12,11 +12,10 @@ const ViewCourseFeedback = () => {
   useEffect(() => {
     const fetchFeedback = async () => {
       try {
-        const response = await api.get(`/api/feedback/feedback/`)
-        const filteredFeedback = response.data.filter((item) => item.course === Number(id))
-        setFeedback(filteredFeedback)
+        const courseFeedback = await fetchAllPages(`/api/feedback/feedback/?course=${id}`)
+        setFeedback(courseFeedback)
 
-        filteredFeedback.forEach((item) => fetchUser(item.student))
+        courseFeedback.forEach((item) => fetchUser(item.student))
       } catch (error) {
         console.error('Error fetching feedback:', error)
       } finally {
@@ -11,7 +11,7 @@ import {
 import { useNavigate } from 'react-router-dom'
 
 
-import api from '../../../services/api'
+import { fetchAllPages } from '../../../services/api'
 
 const CoursesList = () => {
   const [query, setQuery] = useState('')
@@ -22,8 +22,7 @@ const CoursesList = () => {
   useEffect(() => {
     const fetchCourses = async () => {
       try {
-        const response = await api.get(`/api/courses/course/search/?${searchField}=${query}`)
-        setCourses(response.data)
+        setCourses(await fetchAllPages(`/api/courses/course/search/?${searchField}=${query}`))
       } catch (error) {
         console.error('Error fetching courses:', error)
       }
@@ -10,7 +10,7 @@ import {
   CFormSelect,
 } from '@coreui/react'
 
-import api from '../../../../services/api'
+import { fetchAllPages } from '../../../../services/api'
 import { useNavigate } from 'react-router-dom'
 
 const UserSearch = () => {
@@ -21,9 +21,8 @@ const UserSearch = () => {
 
   useEffect(() => {
     if (query.length > 2) {
-      api
-        .get(`/api/auth/user/search/?${searchField}=${query}`)
-        .then((response) => setUsers(response.data))
+      fetchAllPages(`/api/auth/user/search/?${searchField}=${query}`)
+        .then(setUsers)
         .catch((error) => {
           console.error('Error fetching users:', error)
           setUsers([])
@@ -2,19 +2,20 @@ import React, { useEffect, useState } from 'react'
 import { CCard, CCardBody, CCardHeader, CCol, CRow, CButton } from '@coreui/react'
 import { useNavigate } from 'react-router-dom'
 
-import api from '../../../services/api'
+import { fetchAllPages } from '../../../services/api'
 import CIcon from '@coreui/icons-react'
 import {  cilFolderOpen } from '@coreui/icons'
 
 const EnrolledCourses = () => {
   const [courses, setCourses] = useState([])
+  const [loaded, setLoaded] = useState(false)
   const navigate = useNavigate()
 
   useEffect(() => {
     const fetchCourses = async () => {
       try {
-        const response = await api.get(`/api/courses/list/students/`)
-        setCourses(response.data)
+        setCourses(await fetchAllPages(`/api/courses/list/students/`))
+        setLoaded(true)
       } catch (error) {
         console.error('Error fetching courses:', error)
       }
@@ -28,10 +29,10 @@ const EnrolledCourses = () => {
     return <div>Access Denied</div>
   }
   
-  if (courses.message){
+  if (loaded && courses.length === 0){
     return (
       <div className="text-center">
-        <h4>{courses.message}</h4>
+        <h4>You are not enrolled in any courses.</h4>
       </div>
     )
   }
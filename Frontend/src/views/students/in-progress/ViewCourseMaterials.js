@@ -8,7 +8,7 @@ import {
   CTableDataCell,
   CButton,
 } from '@coreui/react'
-import api from '../../../services/api'
+import { fetchAllPages } from '../../../services/api'
 import { useParams } from 'react-router-dom'
 
 const ViewCourseMaterials = () => {
@@ -17,9 +17,8 @@ const ViewCourseMaterials = () => {
   const [materials, setMaterials] = useState([])
 
    useEffect(() => {
-     api
-       .get(`/api/courses/materials/${id}/`)
-       .then((response) => setMaterials(response.data))
+     fetchAllPages(`/api/courses/materials/${id}/`)
+       .then(setMaterials)
        .catch((error) => console.error('Error fetching materials:', error))
    }, [id])
 
@@ -15,11 +15,12 @@ import {
 import CIcon from '@coreui/icons-react'
 import { cilPencil, cilTrash, cilCloudUpload, cilFolderOpen, cilUser } from '@coreui/icons'
 
-import api from '../../../services/api'
+import api, { fetchAllPages } from '../../../services/api'
 import { useNavigate } from 'react-router-dom'
 
 const ViewCourses = () => {
   const [courses, setCourses] = useState([])
+  const [loaded, setLoaded] = useState(false)
   const [visible, setVisible] = useState(false)
   const [selectedCourse, setSelectedCourse] = useState(null)
   const navigate = useNavigate()
@@ -27,8 +28,8 @@ const ViewCourses = () => {
   useEffect(() => {
     const fetchTeacherCourses = async () => {
       try {
-        const response = await api.get(`/api/courses/list/`)
-        setCourses(response.data)
+        setCourses(await fetchAllPages(`/api/courses/list/`))
+        setLoaded(true)
       } catch (error) {
         console.error('Error fetching courses:', error)
       }
@@ -55,12 +56,12 @@ const ViewCourses = () => {
     return <div>Access Denied</div>
   }
 
-  if (courses.message) {
+  if (loaded && courses.length === 0) {
     return (
       <div className="text-right">
         <CCard>
           <CCardBody>
-            <h4>{courses.message}</h4>
+            <h4>You have not created any courses.</h4>
             <CButton color="primary" onClick={() => navigate('/teachers/manage-courses/create')}>
               Create Course
             </CButton>
@@ -13,17 +13,16 @@ import {
 } from '@coreui/react'
 import CIcon from '@coreui/icons-react'
 import { cilXCircle, cilCheck } from '@coreui/icons'
-import api from '../../../services/api'
+import api, { fetchAllPages } from '../../../services/api'
 
 const ViewEnrolledStudents = () => {
   const [students, setStudents] = useState({})
 
   useEffect(() => {
-    api
-      .get('/api/courses/teacher/students/')
-      .then((response) => {
+    fetchAllPages('/api/courses/teacher/students/')
+      .then((enrollments) => {
         // Group students by course title
-        const groupedStudents = response.data.reduce((acc, student) => {
+        const groupedStudents = enrollments.reduce((acc, student) => {
           const courseTitle = student.course_title
           if (!acc[courseTitle]) {
             acc[courseTitle] = []